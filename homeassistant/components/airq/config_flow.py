@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-from aioairq import AirQ, InvalidAuth
+from aioairq import AirQ, DeviceInfo, InvalidAuth
 from aiohttp.client_exceptions import ClientConnectionError
 import voluptuous as vol
 
@@ -41,6 +42,21 @@ OPTIONS_FLOW = {
 }
 
 
+async def _async_validate_and_fetch_device_info(airq: AirQ) -> DeviceInfo:
+    """Validate the password and fetch the device info concurrently."""
+    # Both requests fail with the same exceptions on a wrong password or
+    # an unreachable device, so there is no need to wait for one another.
+    # The task group cancels the remaining request as soon as one fails.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(airq.validate())
+            device_info = tg.create_task(airq.fetch_device_info())
+    except ExceptionGroup as err:
+        # Raise the first error unwrapped, as if the requests were awaited in turn.
+        raise err.exceptions[0] from None
+    return device_info.result()
+
+
 class AirQConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for air-Q."""
 
@@ -60,7 +76,7 @@ class AirQConfigFlow(ConfigFlow, domain=DOMAIN):
         session = async_get_clientsession(self.hass)
         airq = AirQ(user_input[CONF_IP_ADDRESS], user_input[CONF_PASSWORD], session)
         try:
-            await airq.validate()
+            device_info = await _async_validate_and_fetch_device_info(airq)
         except ClientConnectionError:
             _LOGGER.debug(
                 (
@@ -79,7 +95,6 @@ class AirQConfigFlow(ConfigFlow, domain=DOMAIN):
         else:
             _LOGGER.debug("Successfully connected to %s", user_input[CONF_IP_ADDRESS])
 
-            device_info = await airq.fetch_device_info()
             await self.async_set_unique_id(device_info["id"])
             self._abort_if_unique_id_configured()
 
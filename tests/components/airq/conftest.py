@@ -3,8 +3,23 @@
 from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
 
+from aioairq import DeviceInfo
 import pytest
 
+from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD
+
+TEST_USER_DATA = {
+    CONF_IP_ADDRESS: "192.168.0.0",
+    CONF_PASSWORD: "password",
+}
+TEST_DEVICE_INFO = DeviceInfo(
+    id="id",
+    name="name",
+    model="model",
+    sw_version="sw",
+    hw_version="hw",
+)
+
 
 @pytest.fixture
 def mock_setup_entry() -> Generator[AsyncMock]:
@@ -1,5 +1,6 @@
 """Test the air-Q config flow."""
 
+import asyncio
 from unittest.mock import patch
 
 from aioairq import DeviceInfo, InvalidAuth
@@ -12,25 +13,16 @@ from homeassistant.components.airq.const import (
     CONF_RETURN_AVERAGE,
     DOMAIN,
 )
-from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD
+from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
+from .conftest import TEST_DEVICE_INFO, TEST_USER_DATA
+
 from tests.common import MockConfigEntry
 
 pytestmark = pytest.mark.usefixtures("mock_setup_entry")
 
-TEST_USER_DATA = {
-    CONF_IP_ADDRESS: "192.168.0.0",
-    CONF_PASSWORD: "password",
-}
-TEST_DEVICE_INFO = DeviceInfo(
-    id="id",
-    name="name",
-    model="model",
-    sw_version="sw",
-    hw_version="hw",
-)
 DEFAULT_OPTIONS = {
     CONF_CLIP_NEGATIVE: True,
     CONF_RETURN_AVERAGE: True,
@@ -66,7 +58,10 @@ async def test_form_invalid_auth(hass: HomeAssistant) -> None:
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
 
-    with patch("aioairq.AirQ.validate", side_effect=InvalidAuth):
+    with (
+        patch("aioairq.AirQ.validate", side_effect=InvalidAuth),
+        patch("aioairq.AirQ.fetch_device_info", return_value=TEST_DEVICE_INFO),
+    ):
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"], TEST_USER_DATA | {CONF_PASSWORD: "wrong_password"}
         )
@@ -81,7 +76,10 @@ async def test_form_cannot_connect(hass: HomeAssistant) -> None:
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
 
-    with patch("aioairq.AirQ.validate", side_effect=ClientConnectionError):
+    with (
+        patch("aioairq.AirQ.validate", side_effect=ClientConnectionError),
+        patch("aioairq.AirQ.fetch_device_info", return_value=TEST_DEVICE_INFO),
+    ):
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"], TEST_USER_DATA
         )
@@ -90,6 +88,95 @@ async def test_form_cannot_connect(hass: HomeAssistant) -> None:
     assert result2["errors"] == {"base": "cannot_connect"}
 
 
+@pytest.mark.parametrize(
+    ("exception", "error"),
+    [(InvalidAuth, "invalid_auth"), (ClientConnectionError, "cannot_connect")],
+)
+async def test_form_error_cancels_pending_request(
+    hass: HomeAssistant, exception: type[Exception], error: str
+) -> None:
+    """Test a failed validation cancels the still running device info request."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    fetch_started = asyncio.Event()
+    fetch_cancelled = asyncio.Event()
+
+    async def slow_fetch_device_info() -> DeviceInfo:
+        fetch_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            fetch_cancelled.set()
+            raise
+        return TEST_DEVICE_INFO
+
+    async def failing_validate() -> None:
+        await fetch_started.wait()
+        raise exception
+
+    with (
+        patch("aioairq.AirQ.validate", side_effect=failing_validate),
+        patch("aioairq.AirQ.fetch_device_info", side_effect=slow_fetch_device_info),
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], TEST_USER_DATA
+        )
+
+    assert fetch_cancelled.is_set()
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["errors"] == {"base": error}
+
+
+@pytest.mark.parametrize(
+    ("validate_side_effect", "exception", "error"),
+    [
+        (None, InvalidAuth, "invalid_auth"),
+        (InvalidAuth, InvalidAuth, "invalid_auth"),
+        (None, ClientConnectionError, "cannot_connect"),
+        (ClientConnectionError, ClientConnectionError, "cannot_connect"),
+    ],
+)
+async def test_form_fetch_device_info_error(
+    hass: HomeAssistant,
+    validate_side_effect: type[Exception] | None,
+    exception: type[Exception],
+    error: str,
+) -> None:
+    """Test errors from fetching the device info map to a single form error."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with (
+        patch("aioairq.AirQ.validate", side_effect=validate_side_effect),
+        patch("aioairq.AirQ.fetch_device_info", side_effect=exception),
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], TEST_USER_DATA
+        )
+
+    assert result2["type"] is FlowResultType.FORM
+    assert result2["errors"] == {"base": error}
+
+
+async def test_form_unexpected_error(hass: HomeAssistant) -> None:
+    """Test unexpected errors are raised as is and not as an exception group."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with (
+        patch("aioairq.AirQ.validate"),
+        patch("aioairq.AirQ.fetch_device_info", side_effect=ValueError),
+        pytest.raises(ValueError),
+    ):
+        await hass.config_entries.flow.async_configure(
+            result["flow_id"], TEST_USER_DATA
+        )
+
+
 async def test_duplicate_error(hass: HomeAssistant) -> None:
     """Test that errors are shown when duplicates are added."""
     MockConfigEntry(
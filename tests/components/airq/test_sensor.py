@@ -0,0 +1,106 @@
+"""Test the air-Q sensor platform."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.airq.const import DOMAIN
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .conftest import TEST_DEVICE_INFO, TEST_USER_DATA
+
+from tests.common import MockConfigEntry
+
+TEST_DATA = {
+    "co2": 500.0,
+    "temperature": 21.5,
+}
+
+
+@pytest.mark.parametrize(
+    ("device_status", "expected_keys"),
+    [
+        ("OK", {"co2", "temperature"}),
+        (
+            {
+                "tvoc": "VOC sensor still in warm up phase; waiting time = 18 s",
+                "o3": 0,
+                "no2": "OK",
+            },
+            {"co2", "temperature", "tvoc"},
+        ),
+    ],
+)
+async def test_warming_up_sensors(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_status: dict[str, str | int] | str,
+    expected_keys: set[str],
+) -> None:
+    """Test only reported and warming up sensors are added."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=TEST_USER_DATA, unique_id=TEST_DEVICE_INFO["id"]
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch("aioairq.AirQ.fetch_device_info", return_value=TEST_DEVICE_INFO),
+        patch(
+            "aioairq.AirQ.get_latest_data",
+            return_value=TEST_DATA | {"Status": device_status},
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    assert {entity.unique_id for entity in entities} == {
+        f"{TEST_DEVICE_INFO['id']}_{key}" for key in expected_keys
+    }
+
+
+async def test_sensor_values(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test sensor states are read from the data, transforming where needed."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=TEST_USER_DATA, unique_id=TEST_DEVICE_INFO["id"]
+    )
+    entry.add_to_hass(hass)
+
+    def get_state(key: str) -> str:
+        entity_id = entity_registry.async_get_entity_id(
+            SENSOR_DOMAIN, DOMAIN, f"{TEST_DEVICE_INFO['id']}_{key}"
+        )
+        assert entity_id is not None
+        state = hass.states.get(entity_id)
+        assert state is not None
+        return state.state
+
+    data = TEST_DATA | {
+        "Status": "OK",
+        "health": 850.0,
+        "performance": 700.0,
+        "virus": 12.0,
+    }
+    with (
+        patch("aioairq.AirQ.fetch_device_info", return_value=TEST_DEVICE_INFO),
+        patch("aioairq.AirQ.get_latest_data", return_value=data),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert get_state("co2") == "500.0"
+    assert get_state("health") == "85.0"
+    assert get_state("performance") == "70.0"
+    assert get_state("virus") == "12.0"
+
+    data = {key: value for key, value in data.items() if key != "virus"}
+    with patch("aioairq.AirQ.get_latest_data", return_value=data):
+        await entry.runtime_data.async_refresh()
+        await hass.async_block_till_done()
+
+    assert get_state("co2") == "500.0"
+    assert get_state("virus") == "0.0"